@@ -4,8 +4,10 @@ It is used to draw lines, text, and clear sections of the display.
 """
 
 import platform
+import threading
 import time
 import math
+from functools import lru_cache
 
 from on_deck.colors import Colors
 
@@ -28,20 +30,73 @@ def get_options() -> RGBMatrixOptions:
 
     return options
 
+@lru_cache(maxsize=32)
+def _circle_offsets(radius: int, thickness: int, fill: bool) -> tuple:
+    """
+    Returns the (dx, dy) offsets from the center of every pixel of a
+    circle. The circles drawn only come in a few sizes so the pixels
+    are only worked out once per size and reused for every draw.
+
+    Args:
+        radius (int): Radius of the circle
+        thickness (int): Thickness of the circle
+        fill (bool): Whether or not to fill the circle
+
+    Returns:
+        tuple: Unique (dx, dy) pixel offsets
+    """
+    offsets = []
+
+    start = radius
+    stop = radius - thickness
+    if fill:
+        stop = 0
+        offsets.append((0, 0)) # Not included in the loops
+
+    for degrees in range(0, 91, 1):
+        # Used to get rotational symmetry
+        for r in range(start, stop, -1):
+            # Used to prevent .5 (sin30 or cos60)
+            # to get rounded to nearest even number
+            # Want to avoid any errors with things getting rounded
+            # up in one direction but down in the other
+            r_eff = r - .01
+
+            for d in (degrees, degrees + 90, degrees + 180, degrees + 270):
+                a = math.radians(d)
+                offsets.append((round(r_eff * math.cos(a)), round(r_eff * math.sin(a))))
+
+    # Many angles land on the same pixel so only keep each one once
+    return tuple(dict.fromkeys(offsets))
+
 class DisplayManager:
     """
     This class is used to manage the display of the scoreboard.
     """
+    __slots__ = ('options', 'matrix', 'canvas', 'brightness', '_swap_lock',
+        '_swap_pending', '_clear_color')
+
     def __init__(self, options: RGBMatrixOptions = None):
         self.options = options
         self.matrix = RGBMatrix(options=self.options)
         self.canvas = self.matrix.CreateFrameCanvas()
         self.brightness = 255
 
+        # Several threads draw into the same canvas and swap it. Swaps
+        # requested while another thread is swapping are merged into
+        # one extra swap by that thread
+        self._swap_lock = threading.Lock()
+        self._swap_pending = False
+
+        # Color used to clear sections. Grey on the emulated display so
+        # cleared sections can be seen
+        self._clear_color = Colors.black
+
         if platform.system() == 'Windows':
             # Fill the screen with grey so that the pixels can be seen
             # on the emulated display
             self.matrix.Fill(20, 20, 20)
+            self._clear_color = Colors.grey
 
     def set_brightness(self, brightness: int):
         """This method is used to change the brightness of the display."""
@@ -51,8 +106,21 @@ class DisplayManager:
         self.matrix.brightness = brightness
 
     def swap_frame(self):
-        """This method is used to swap the frame on the display."""
-        self.matrix.SwapOnVSync(self.canvas)
+        """
+        This method is used to swap the frame on the display. If another
+        thread is already swapping, it will swap once more after it is
+        done instead of this thread waiting for the next vsync as well.
+        """
+        self._swap_pending = True
+        while self._swap_pending:
+            if not self._swap_lock.acquire(blocking=False):
+                return
+            try:
+                while self._swap_pending:
+                    self._swap_pending = False
+                    self.matrix.SwapOnVSync(self.canvas)
+            finally:
+                self._swap_lock.release()
 
     def draw_pixel(self, x: int, y: int, color: graphics.Color):
         """This method is used to draw a pixel on the display."""
@@ -68,6 +136,16 @@ class DisplayManager:
         """This method is used to draw text on the display."""
         graphics.DrawText(self.canvas, font, x, y, color, text)
 
+    def draw_text_batch(self, items):
+        """
+        This method is used to draw several texts on the display at
+        once. Each item is a (font, x, y, color, text) tuple.
+        """
+        canvas = self.canvas
+        draw_text = graphics.DrawText
+        for font, x, y, color, text in items:
+            draw_text(canvas, font, x, y, color, text)
+
     def draw_circle(self, x: int, y: int, radius: int, thickness: int,
         fill: bool, color: graphics.Color):
         """
@@ -81,47 +159,11 @@ class DisplayManager:
             fill (bool): Whether or not to fill the circle
             color (graphics.Color): Color of the circle
         """
+        set_pixel = self.canvas.SetPixel
+        red, green, blue = color.red, color.green, color.blue
 
-        start = radius
-        stop = radius - thickness
-        if fill:
-            stop = 0
-            self.draw_pixel(x, y, color) # Not included in the loops
-
-        for degrees in range(0, 91, 1):
-            # Used to get rotational symmetry
-            for r in range(start, stop, -1):
-                # Used to prevent .5 (sin30 or cos60)
-                # to get rounded to nearest even number
-                # Want to avoid any errors with things getting rounded
-                # up in one direction but down in the other
-                r_eff = r - .01
-
-                d1 = degrees
-                d2 = d1 + 90
-                d3 = d2 + 90
-                d4 = d3 + 90
-
-                a1 = math.radians(d1)
-                a2 = math.radians(d2)
-                a3 = math.radians(d3)
-                a4 = math.radians(d4)
-
-                x1 = round(x + r_eff * math.cos(a1))
-                y1 = round(y + r_eff * math.sin(a1))
-                self.draw_pixel(x1, y1, color)
-
-                x2 = round(x + r_eff * math.cos(a2))
-                y2 = round(y + r_eff * math.sin(a2))
-                self.draw_pixel(x2, y2, color)
-
-                x3 = round(x + r_eff * math.cos(a3))
-                y3 = round(y + r_eff * math.sin(a3))
-                self.draw_pixel(x3, y3, color)
-
-                x4 = round(x + r_eff * math.cos(a4))
-                y4 = round(y + r_eff * math.sin(a4))
-                self.draw_pixel(x4, y4, color)
+        for dx, dy in _circle_offsets(radius, thickness, fill):
+            set_pixel(x + dx, y + dy, red, green, blue)
 
     def draw_box(self, x1: int, y1: int, x2: int, y2: int, color: graphics.Color):
         self.draw_line(x1, y1, x2, y1, color) # Top
@@ -168,6 +210,47 @@ class DisplayManager:
             self.draw_line(x3, y3, x4, y4, color)
             self.draw_line(x4, y4, x1, y1, color)
 
+    def draw_bases(self, x: int, y: int, radius: int, delta: int, thickness: int,
+        bases: tuple, color: graphics.Color):
+        """
+        This method is used to draw the three bases of a diamond in one
+        call. First and third base are drawn delta pixels below and to
+        the side of second base.
+
+        Args:
+            x (int): X coordinate of the center of second base
+            y (int): Y coordinate of the center of second base
+            radius (int): Distance between center and corners of a base
+            delta (int): Distance between second base and the other bases
+            thickness (int): Thickness of the bases
+            bases (tuple): Whether or not first, second and third base
+                are filled in
+            color (graphics.Color): Color of the bases
+        """
+        self.draw_diamond(x + delta, y + delta, radius, thickness, bases[0], color)
+        self.draw_diamond(x, y, radius, thickness, bases[1], color)
+        self.draw_diamond(x - delta, y + delta, radius, thickness, bases[2], color)
+
+    def draw_circle_row(self, x: int, y: int, delta: int, radius: int,
+        thickness: int, filled: tuple, color: graphics.Color):
+        """
+        This method is used to draw a row of circles in one call, such
+        as the balls, strikes or outs of the count.
+
+        Args:
+            x (int): X coordinate of the center of the first circle
+            y (int): Y coordinate of the center of the circles
+            delta (int): Distance between the centers of the circles
+            radius (int): Radius of the circles
+            thickness (int): Thickness of the circles
+            filled (tuple): Whether or not each circle is filled in. One
+                circle is drawn per item
+            color (graphics.Color): Color of the circles
+        """
+        for fill in filled:
+            self.draw_circle(x, y, radius, thickness, fill, color)
+            x += delta
+
     def draw_inning_arrow(self, x: int, y: int, height: int, up: bool,
         color: graphics.Color):
         """
@@ -195,14 +278,18 @@ class DisplayManager:
     def clear_section(self, x1, y1, x2, y2):
         """This method is used to clear a section of the display."""
         num_rows = y2 - y1 + 1
+        num_columns = x2 - x1 + 1
 
-        if platform.system() == 'Windows':
-            color = Colors.grey
-        else:
-            color = Colors.black
+        color = self._clear_color
 
-        for i in range(num_rows):
-            graphics.DrawLine(self.canvas, x1, y1 + i, x2, y1 + i, color)
+        # Each line is one call into the library so clear the section
+        # with whichever of rows or columns needs fewer lines
+        if num_columns < num_rows:
+            for i in range(num_columns):
+                graphics.DrawLine(self.canvas, x1 + i, y1, x1 + i, y2, color)
+        else:
+            for i in range(num_rows):
+                graphics.DrawLine(self.canvas, x1, y1 + i, x2, y1 + i, color)
 
 if __name__ == '__main__':
     display = DisplayManager(get_options())
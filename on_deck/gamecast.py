@@ -1,101 +1,132 @@
-from typing import Union
+from functools import lru_cache
+from typing import Union, TYPE_CHECKING
 
 from on_deck.colors import Colors
 from on_deck.fonts import Fonts
 from on_deck.display_manager import DisplayManager
+from on_deck.tables import (RUNNER_TABLE, BALL_TABLE, STRIKE_TABLE, OUT_TABLE,
+    DIGITS, double_digit_offsets)
+
+if TYPE_CHECKING:
+    from rgbmatrix import graphics # pylint: disable=E0401
+
+# Double digit offsets for the ter_u16b font
+_DD_OFFSET = double_digit_offsets(4)
+
+@lru_cache(maxsize=256)
+def _batting_order_line(position: str, name: str, ops: str) -> str:
+    """
+    Formats one line of the batting order. The same nine batters are
+    printed over and over so the lines are cached
+    """
+    return rf'{position:>2s} {name[:11]:11s}{ops}'
 
 class Gamecast:
+    __slots__ = ('display_manager', 'game', '_white', '_yellow', '_green', '_red',
+        '_font', '_clear_section', '_draw_text', '_draw_text_batch',
+        '_draw_circle_row', '_draw_bases', '_draw_inning_arrow',
+        '_prev_game')
+
     def __init__(self, display_manager: DisplayManager):
         self.display_manager = display_manager
         self.game: dict = None
 
-        self._ddo = 4 # double digit offset
+        # Bind the colors, font and drawing methods once so the print
+        # methods do not have to look them up on every draw
+        self._white = Colors.white
+        self._yellow = Colors.yellow
+        self._green = Colors.green
+        self._red = Colors.red
+        self._font = Fonts.ter_u16b
+
+        self._clear_section = display_manager.clear_section
+        self._draw_text = display_manager.draw_text
+        self._draw_text_batch = display_manager.draw_text_batch
+        self._draw_circle_row = display_manager.draw_circle_row
+        self._draw_bases = display_manager.draw_bases
+        self._draw_inning_arrow = display_manager.draw_inning_arrow
+
+        # Inputs of each section as they were last drawn. Used to skip
+        # redrawing sections that have not changed since the last frame
+        self._prev_game: dict = {}
+
+    def _changed(self, key: str, value) -> bool:
+        """
+        Checks if the value of a section differs from the value that
+        was last drawn and remembers the new value if it does.
+
+        Args:
+            key (str): Name of the section
+            value: Inputs of the section. Must be a copy so that in
+                place updates to the game are detected
+
+        Returns:
+            bool: True if the section needs to be redrawn
+        """
+        if key in self._prev_game and self._prev_game[key] == value:
+            return False
+        self._prev_game[key] = value
+        return True
 
     def _print_team_names(self, away: dict, home: dict):
-        color = Colors.white
+        color = self._white
 
         # self.display_manager.clear_section(129, 0, 200, 28)
-        self.display_manager.clear_section(129, 0, 200, 28)
-        self.display_manager.draw_text(Fonts.ter_u16b, 129, 12, color, away['name'])
-        self.display_manager.draw_text(Fonts.ter_u16b, 129, 24, color, home['name'])
+        self._clear_section(129, 0, 200, 28)
+        self._draw_text_batch((
+            (self._font, 129, 12, color, away['name']),
+            (self._font, 129, 24, color, home['name']),
+        ))
 
     def _print_linescore(self, home: bool, runs: int, hits: int, errors: int, lob: int):
-        color = Colors.white
+        color = self._white
         row_offset = 24 if home else 12
 
-        run_column_offset = 80
-        hit_column_offset = 100
-        error_column_offset = 116
-        lob_column_offset = 132
-
-        run_column_offset -= self._ddo if runs >= 10 else 0
-        hit_column_offset -= self._ddo if hits >= 10 else 0
-        lob_column_offset -= self._ddo if lob >= 10 else 0
-
-        if runs >= 10:
-            self.display_manager.draw_text(Fonts.ter_u16b, 128 + run_column_offset,
-                row_offset, Colors.yellow, f'{runs}')
-        else:
-            self.display_manager.draw_text(Fonts.ter_u16b, 128 + run_column_offset,
-                row_offset, Colors.yellow, f'{runs}')
-
-        if hits >= 10:
-            self.display_manager.draw_text(Fonts.ter_u16b, 128 + hit_column_offset,
-                row_offset, color, f'{hits}')
-        else:
-            self.display_manager.draw_text(Fonts.ter_u16b, 128 + hit_column_offset,
-                row_offset, color, f'{hits}')
-
-        self.display_manager.draw_text(Fonts.ter_u16b, 128 + error_column_offset,
-            row_offset, color, f'{errors}')
-
-        if lob >= 10:
-            self.display_manager.draw_text(Fonts.ter_u16b, 128 + lob_column_offset,
-                row_offset, color, f'{lob}')
-        else:
-            self.display_manager.draw_text(Fonts.ter_u16b, 128 + lob_column_offset,
-                row_offset, color, f'{lob}')
-
-    def _print_linescores(self, away: dict, home: dict):
-        self.display_manager.clear_section(200, 0, 275, 24)
-
-        runs = away['runs']
-        hits = away['hits']
-        errors = away['errors']
-        lob = away['left_on_base']
-        self._print_linescore(False, runs, hits, errors, lob)
-
-        runs = home['runs']
-        hits = home['hits']
-        errors = home['errors']
-        lob = home['left_on_base']
-        self._print_linescore(True, runs, hits, errors, lob)
+        # Only clear this team's row so the other row can be left as is
+        top_row = 13 if home else 0
+        self._clear_section(200, top_row, 275, row_offset)
+
+        # Columns are relative to the left edge of the gamecast (128)
+        run_column_offset = 128 + 80 - _DD_OFFSET[min(runs, 99)]
+        hit_column_offset = 128 + 100 - _DD_OFFSET[min(hits, 99)]
+        error_column_offset = 128 + 116
+        lob_column_offset = 128 + 132 - _DD_OFFSET[min(lob, 99)]
+
+        runs_str = DIGITS[runs] if runs < 100 else str(runs)
+        hits_str = DIGITS[hits] if hits < 100 else str(hits)
+        errors_str = DIGITS[errors] if errors < 100 else str(errors)
+        lob_str = DIGITS[lob] if lob < 100 else str(lob)
+
+        font = self._font
+        self._draw_text_batch((
+            (font, run_column_offset, row_offset, self._yellow, runs_str),
+            (font, hit_column_offset, row_offset, color, hits_str),
+            (font, error_column_offset, row_offset, color, errors_str),
+            (font, lob_column_offset, row_offset, color, lob_str),
+        ))
 
     def _print_inning(self, inning: int, inning_state: str):
-        self.display_manager.clear_section(275, 0, 293, 24)
+        self._clear_section(275, 0, 293, 24)
 
         column_offset = 128 + 152
         row_offset = 18
         arrow_size = 5
 
-        color = Colors.white
+        color = self._white
+        inning_str = DIGITS[inning] if inning < 100 else str(inning)
 
-        if inning >= 10:
-            self.display_manager.draw_text(Fonts.ter_u16b, column_offset - self._ddo,
-                row_offset, color, f'{inning}')
-        else:
-            self.display_manager.draw_text(Fonts.ter_u16b, column_offset,
-                row_offset, color, f'{inning}')
+        self._draw_text(self._font, column_offset - _DD_OFFSET[min(inning, 99)],
+            row_offset, color, inning_str)
 
         if inning_state == 'T':
-            self.display_manager.draw_inning_arrow(column_offset+3, row_offset-12,
+            self._draw_inning_arrow(column_offset+3, row_offset-12,
                 arrow_size, True, color)
         elif inning_state == 'B':
-            self.display_manager.draw_inning_arrow(column_offset+3, row_offset+1,
+            self._draw_inning_arrow(column_offset+3, row_offset+1,
                 arrow_size, False, color)
 
     def _print_bases(self, runners: int):
-        self.display_manager.clear_section(293, 0, 328, 24)
+        self._clear_section(293, 0, 328, 24)
 
         second_base_column_offset = 128 + 182
         second_base_row_offset = 8
@@ -106,145 +137,91 @@ class Gamecast:
 
         thickness = 2
 
-        bases = [False, False, False]
+        bases = RUNNER_TABLE[runners & 7]
+
+        self._draw_bases(second_base_column_offset, second_base_row_offset,
+            base_length, base_offset, thickness, bases, self._white)
 
-        if runners & 1:
-            bases[0] = True
-        if runners & 2:
-            bases[1] = True
-        if runners & 4:
-            bases[2] = True
+    def _print_count(self, row_offset: int, value: int, table: tuple,
+        color: 'graphics.Color'):
+        """
+        Prints one row of the count (balls, strikes or outs). Only the
+        row is cleared so the other rows can be left untouched.
 
-        self.display_manager.draw_diamond(second_base_column_offset - base_offset,
-            second_base_row_offset + base_offset, base_length, thickness, bases[2], Colors.white)
-        self.display_manager.draw_diamond(second_base_column_offset,
-            second_base_row_offset, base_length, thickness, bases[1], Colors.white)
-        self.display_manager.draw_diamond(second_base_column_offset + base_offset,
-            second_base_row_offset + base_offset, base_length, thickness, bases[0], Colors.white)
+        Args:
+            row_offset (int): Y coordinate of the center of the circles
+            value (int): Number of circles to fill in
+            table (tuple): Lookup table of which circles are filled in
+                for each value
+            color (graphics.Color): Color of the circles
+        """
+        self._clear_section(328, row_offset - 4, 370, row_offset + 3)
 
-    def _print_count(self, count: dict):
-        self.display_manager.clear_section(328, 0, 370, 24)
+        if value is None:
+            return
 
         circle_column_offset = 128 + 206
-        ball_row_offset = 4
-        strike_row_offset = 12
-        out_row_offset = 20
 
         radius = 3
         gap = 1
         thickness = 1
         delta = 2*radius + gap + 1
 
-        balls_int = count.get('balls', None)
-        if balls_int is not None:
-            balls = [False, False, False, False]
-            if balls_int >= 1:
-                balls[0] = True
-            if balls_int >= 2:
-                balls[1] = True
-            if balls_int >= 3:
-                balls[2] = True
-            if balls_int >= 4:
-                balls[3] = True
-
-            self.display_manager.draw_circle(circle_column_offset + 0*delta,
-                ball_row_offset, radius, thickness, balls[0], Colors.green)
-            self.display_manager.draw_circle(circle_column_offset + 1*delta,
-                ball_row_offset, radius, thickness, balls[1], Colors.green)
-            self.display_manager.draw_circle(circle_column_offset + 2*delta,
-                ball_row_offset, radius, thickness, balls[2], Colors.green)
-            self.display_manager.draw_circle(circle_column_offset + 3*delta,
-                ball_row_offset, radius, thickness, balls[3], Colors.green)
-
-
-        strikes_int = count.get('strikes', None)
-        if strikes_int is not None:
-            strikes = [False, False, False]
-            if strikes_int >= 1:
-                strikes[0] = True
-            if strikes_int >= 2:
-                strikes[1] = True
-            if strikes_int >= 3:
-                strikes[2] = True
-
-            self.display_manager.draw_circle(circle_column_offset + 0*delta,
-                strike_row_offset, radius, thickness, strikes[0], Colors.red)
-            self.display_manager.draw_circle(circle_column_offset + 1*delta,
-                strike_row_offset, radius, thickness, strikes[1], Colors.red)
-            self.display_manager.draw_circle(circle_column_offset + 2*delta,
-                strike_row_offset, radius, thickness, strikes[2], Colors.red)
-
-
-        outs_int = count.get('outs', None)
-        if outs_int is not None:
-            outs = [False, False, False]
-            if outs_int >= 1:
-                outs[0] = True
-            if outs_int >= 2:
-                outs[1] = True
-            if outs_int >= 3:
-                outs[2] = True
-
-            self.display_manager.draw_circle(circle_column_offset + 0*delta,
-                out_row_offset, radius, thickness, outs[0], Colors.white)
-            self.display_manager.draw_circle(circle_column_offset + 1*delta,
-                out_row_offset, radius, thickness, outs[1], Colors.white)
-            self.display_manager.draw_circle(circle_column_offset + 2*delta,
-                out_row_offset, radius, thickness, outs[2], Colors.white)
+        self._draw_circle_row(circle_column_offset, row_offset, delta, radius,
+            thickness, table[min(value, len(table) - 1)], color)
 
     def _print_umpire(self, umpire: dict, away: dict, home: dict):
-        self.display_manager.clear_section(129, 36, 240, 72)
+        self._clear_section(129, 36, 240, 72)
 
         column_offset = 129
         row_offset = 48
 
-        color = Colors.white
+        color = self._white
+        font = self._font
 
         num_missed = umpire['num_missed']
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
-            color, f'# Miss: {num_missed:2d}')
 
-        row_offset += 12
         favor = umpire['home_favor']
-        abv = home['abv']
+        favor_abv = home['abv']
         if favor < 0:
-            abv = away['abv']
+            favor_abv = away['abv']
             favor *= -1
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
-            color, f'FV: {favor:.2f} {abv}')
 
-        row_offset += 12
         wpa = umpire['home_wpa']
-        abv = home['abv']
+        wpa_abv = home['abv']
         if wpa < 0:
-            abv = away['abv']
+            wpa_abv = away['abv']
             wpa *= -1
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
-            color, f'WP: {wpa:.1%} {abv}')
+
+        self._draw_text_batch((
+            (font, column_offset, row_offset, color, f'# Miss: {num_missed:2d}'),
+            (font, column_offset, row_offset+12, color, f'FV: {favor:.2f} {favor_abv}'),
+            (font, column_offset, row_offset+24, color, f'WP: {wpa:.1%} {wpa_abv}'),
+        ))
 
     def _print_run_expectancy(self, run_expectancy: dict):
-        self.display_manager.clear_section(129, 82, 240, 108)
+        self._clear_section(129, 82, 240, 108)
 
         column_offset = 129
         row_offset = 96
 
-        color = Colors.white
+        color = self._white
 
         re_avg = run_expectancy['average_runs']
         re_ts = run_expectancy['to_score']
 
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        self._draw_text(self._font, column_offset, row_offset,
             color, f'AVG:{re_avg:5.2f}')
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset+12,
+        self._draw_text(self._font, column_offset, row_offset+12,
             color, f'1+:{re_ts:5.1%}')
 
     def _print_win_probability(self, win_probability: dict, away: dict, home: dict):
-        self.display_manager.clear_section(129, 108, 240, 120)
+        self._clear_section(129, 108, 240, 120)
 
         column_offset = 129
         row_offset = 120
 
-        color = Colors.white
+        color = self._white
 
         wp_away = win_probability['away']
         wp_home = win_probability['home']
@@ -256,67 +233,75 @@ class Gamecast:
             team = home['abv']
             wp = wp_home
 
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        self._draw_text(self._font, column_offset, row_offset,
             color, f'WP:{wp:5.1%} {team}')
 
     def _print_pitch_details(self, pitch_details: dict):
-        self.display_manager.clear_section(129, 132, 240, 168)
+        self._clear_section(129, 132, 240, 168)
 
         column_offset = 129
         row_offset = 144
 
-        color = Colors.white
+        draw_text = self._draw_text
+        font = self._font
+
+        color = self._white
 
         pitch_type = pitch_details['type']
         if pitch_type is None:
             return
         if pitch_type == 'Four-Seam Fastball':
             pitch_type = 'Four-Seam'
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        draw_text(font, column_offset, row_offset,
             color, f'{pitch_type}')
 
         pitch_speed = pitch_details['speed']
         if pitch_speed is None:
             return
         row_offset += 12
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        draw_text(font, column_offset, row_offset,
             color, f'{pitch_speed:.1f} MPH')
 
-        row_offset += 12
         pitch_zone = pitch_details['zone']
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        if pitch_zone is None:
+            return
+        row_offset += 12
+        draw_text(font, column_offset, row_offset,
             color, 'Zone:')
-        color = Colors.red
+        color = self._red
         if pitch_zone > 9:
-            color = Colors.green
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset+48, row_offset,
+            color = self._green
+        draw_text(font, column_offset+48, row_offset,
             color, f'{pitch_zone:2d}')
 
     def _print_hit_details(self, hit_details: dict):
-        self.display_manager.clear_section(129, 180, 240, 216)
+        self._clear_section(129, 180, 240, 216)
 
         column_offset = 129
         row_offset = 192
 
-        color = Colors.white
+        draw_text = self._draw_text
+        font = self._font
 
-        if hit_details['distance'] is None:
-            self.display_manager.clear_section(column_offset, row_offset,
-                column_offset+128, row_offset+24)
-            return
+        color = self._white
 
         distance = hit_details['distance']
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        exit_velo = hit_details['exit_velo']
+        launch_angle = hit_details['launch_angle']
+
+        # Statcast sometimes only has some of the values for a hit
+        if None in (distance, exit_velo, launch_angle):
+            return
+
+        draw_text(font, column_offset, row_offset,
             color, f'{distance:5.1f} ft')
 
-        exit_velo = hit_details['exit_velo']
         row_offset += 12
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        draw_text(font, column_offset, row_offset,
             color, f'{exit_velo:5.1f} MPH')
 
-        launch_angle = hit_details['launch_angle']
         row_offset += 12
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
+        draw_text(font, column_offset, row_offset,
             color, f'{launch_angle:5.1f}°')
 
     def _print_batting_order(self, batting_order: dict):
@@ -324,36 +309,107 @@ class Gamecast:
         column_offset = 240
 
         # self.display_manager.draw_box(240, 36, 386, 144, Colors.white)
-        self.display_manager.clear_section(240, 36, 386, 144)
+        self._clear_section(240, 36, 386, 144)
 
         at_bat_index = batting_order['at_bat_index']
         batting_order = batting_order['batting_order']
 
-        for i, batter in enumerate(batting_order):
-            color = Colors.white
-            if at_bat_index == i+1:
-                color = Colors.yellow
+        draw_text = self._draw_text
+        font = self._font
+        white = self._white
+        yellow = self._yellow
+
+        for i, batter in enumerate(batting_order, start=1):
+            color = yellow if at_bat_index == i else white
 
             row_offset += 12
-            name = batter['last_name']
-            ops = batter['ops']
-            position = batter['position']
-            self.display_manager.draw_text(Fonts.ter_u16b, column_offset, row_offset,
-                color, rf'{position:>2s} {name[:11]:11s}{ops}')
-
-    def print_game(self, game: dict):
-        self._print_team_names(game['away'], game['home'])
-        self._print_linescores(game['away'], game['home'])
-        self._print_inning(game['inning'], game['inning_state'])
-        self._print_bases(game['runners'])
-        self._print_count(game['count'])
-        self._print_umpire(game['umpire'], game['away'], game['home'])
-        self._print_run_expectancy(game['run_expectancy'])
-        self._print_win_probability(game['win_probability'], game['away'], game['home'])
-        self._print_pitch_details(game['pitch_details'])
-        self._print_hit_details(game['hit_details'])
-        self._print_batting_order(game['batting_order'])
-        self.display_manager.swap_frame()
+            line = _batting_order_line(batter['position'],
+                batter['last_name'], batter['ops'])
+            draw_text(font, column_offset, row_offset, color, line)
+
+    def print_game(self, game: dict, force: bool = False):
+        """
+        Prints the gamecast game. Only the sections whose inputs changed
+        since the last call are redrawn and the frame is only swapped if
+        something was drawn.
+
+        Args:
+            game (dict): The gamecast game
+            force (bool): Redraw every section. Should be used after
+                the display was cleared or the brightness was changed
+        """
+        if force:
+            self._prev_game = {}
+
+        away = game['away']
+        home = game['home']
+        count = game['count']
+        dirty = False
+
+        if self._changed('team_names', (away['name'], home['name'])):
+            self._print_team_names(away, home)
+            dirty = True
+
+        away_line = (away['runs'], away['hits'], away['errors'], away['left_on_base'])
+        if self._changed('away_linescore', away_line):
+            self._print_linescore(False, *away_line)
+            dirty = True
+
+        home_line = (home['runs'], home['hits'], home['errors'], home['left_on_base'])
+        if self._changed('home_linescore', home_line):
+            self._print_linescore(True, *home_line)
+            dirty = True
+
+        if self._changed('inning', (game['inning'], game['inning_state'])):
+            self._print_inning(game['inning'], game['inning_state'])
+            dirty = True
+
+        if self._changed('runners', game['runners']):
+            self._print_bases(game['runners'])
+            dirty = True
+
+        balls = count.get('balls', None)
+        if self._changed('balls', balls):
+            self._print_count(4, balls, BALL_TABLE, self._green)
+            dirty = True
+
+        strikes = count.get('strikes', None)
+        if self._changed('strikes', strikes):
+            self._print_count(12, strikes, STRIKE_TABLE, self._red)
+            dirty = True
+
+        outs = count.get('outs', None)
+        if self._changed('outs', outs):
+            self._print_count(20, outs, OUT_TABLE, self._white)
+            dirty = True
+
+        abvs = (away['abv'], home['abv'])
+        if self._changed('umpire', (dict(game['umpire']), abvs)):
+            self._print_umpire(game['umpire'], away, home)
+            dirty = True
+
+        if self._changed('run_expectancy', dict(game['run_expectancy'])):
+            self._print_run_expectancy(game['run_expectancy'])
+            dirty = True
+
+        if self._changed('win_probability', (dict(game['win_probability']), abvs)):
+            self._print_win_probability(game['win_probability'], away, home)
+            dirty = True
+
+        if self._changed('pitch_details', dict(game['pitch_details'])):
+            self._print_pitch_details(game['pitch_details'])
+            dirty = True
+
+        if self._changed('hit_details', dict(game['hit_details'])):
+            self._print_hit_details(game['hit_details'])
+            dirty = True
+
+        if self._changed('batting_order', dict(game['batting_order'])):
+            self._print_batting_order(game['batting_order'])
+            dirty = True
+
+        if dirty:
+            self.display_manager.swap_frame()
 
 if __name__ == '__main__':
     print('wrong module dummy')
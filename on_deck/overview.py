@@ -1,28 +1,125 @@
-import math
 import datetime
 
 from on_deck.display_manager import DisplayManager
 from on_deck.colors import Colors
 from on_deck.fonts import Fonts
+from on_deck.tables import RUNNER_TABLE, OUT_TABLE, DIGITS, double_digit_offsets
+
+# Double digit offset for the ter_u28b font
+_DDO = 7
+_DD_OFFSET = double_digit_offsets(_DDO)
+
+def _in_table(value) -> bool:
+    """
+    Returns whether a score or inning is drawn from the lookup tables
+    and so fits the space left for two digits.
+
+    Args:
+        value: The score or inning
+
+    Returns:
+        bool: True if the value is an int from 0 to 99
+    """
+    return isinstance(value, int) and (0 <= value < 100)
+
+def _number_layout(value) -> tuple:
+    """
+    Returns how far to shift a score or inning left and the text to
+    print for it. Numbers from 0 to 99 come from the lookup tables and
+    anything else falls back to str() so odd data still prints.
+
+    Args:
+        value: The score or inning
+
+    Returns:
+        tuple: The offset and the text
+    """
+    if _in_table(value):
+        return _DD_OFFSET[value], DIGITS[value]
+    text = str(value)
+    return _DDO * (len(text) - 1), text
 
 class Overview:
+    __slots__ = ('display_manager', '_games_per_column', '_white', '_green',
+        '_large_font', '_small_font', '_clear_section', '_draw_text',
+        '_draw_circle_row', '_draw_bases', '_draw_inning_arrow',
+        '_last_rendered', '_slot_offsets', '_slot_colors', '_state_printers')
+
     def __init__(self, display_manager: DisplayManager):
         self.display_manager = display_manager
 
-        # Double digit offset for ter_u28b font
-        self._ddo = 7 # double digit offset
         self._games_per_column = 6
 
+        # Bind the colors, fonts and drawing methods once so the print
+        # methods do not have to look them up on every draw
+        self._white = Colors.white
+        self._green = Colors.green
+        self._large_font = Fonts.ter_u28b
+        self._small_font = Fonts.ter_u16b
+
+        self._clear_section = display_manager.clear_section
+        self._draw_text = display_manager.draw_text
+        self._draw_circle_row = display_manager.draw_circle_row
+        self._draw_bases = display_manager.draw_bases
+        self._draw_inning_arrow = display_manager.draw_inning_arrow
+
+        # The fields that affect the pixels of each slot as they were
+        # last drawn. Used to skip slots that have not changed
+        self._last_rendered: dict = {}
+
+        # Offsets and color of every slot on the 3 column display
+        self._slot_offsets = tuple(self._calculate_offset(i) for i in range(18))
+        self._slot_colors = tuple(self._calculate_color(i) for i in range(18))
+
+        # What to draw after the team names for each game state
+        self._state_printers = {
+            'L': (self._print_scores, self._print_inning,
+                self._print_inning_arrows, self._print_bases, self._print_outs),
+            'F': (self._print_scores, self._print_final),
+            'P': (self._print_start_time,),
+            'S': (self._print_scores, self._print_inning, self._print_suspended),
+            'D': (self._print_scores, self._print_inning,
+                self._print_inning_arrows, self._print_delayed),
+        }
+
+    def _snapshot(self, game: dict) -> tuple:
+        """
+        Returns the fields of the game that affect what is drawn in
+        its slot. Two games with equal snapshots look the same.
+
+        Args:
+            game (dict): The game
+
+        Returns:
+            tuple: The fields that affect the pixels of the slot
+        """
+        away = game['away']
+        home = game['home']
+        # Only the team names and game state are drawn for every game.
+        # The rest may be missing for states that do not draw them
+        outs = (game.get('count') or {}).get('outs')
+        return (game['game_state'], away['abv'], home['abv'], away.get('runs'),
+            home.get('runs'), game.get('inning'), game.get('inning_state'),
+            game.get('runners'), outs, game.get('start_time'))
+
     def clear_game(self, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
+        column_offset, row_offset = self._slot_offsets[i]
 
         row_offset -= 20
 
-        self.display_manager.clear_section(column_offset, row_offset,
+        self._clear_section(column_offset, row_offset,
             column_offset + 128, row_offset + 42)
 
+    def invalidate(self):
+        """
+        Forgets what was last drawn in every slot. Should be called
+        after the display was cleared outside of this class so the next
+        print redraws every slot
+        """
+        self._last_rendered.clear()
+
     def _calculate_offset(self, i):
-        column = math.floor(i / self._games_per_column) # column number
+        column = i // self._games_per_column # column number
         column_offset = column * 128
 
         row_offset = 20
@@ -30,80 +127,49 @@ class Overview:
         return (column_offset, row_offset)
 
     def _calculate_color(self, i):
-        column = math.floor(i / self._games_per_column)
+        column = i // self._games_per_column
         middle_column = column & 1
 
         if i % 2 == middle_column:
-            return Colors.white
-        return Colors.green
-
-    def _print_scores(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+            return self._white
+        return self._green
 
+    def _print_scores(self, game: dict, column_offset: int, row_offset: int, color):
         column_offset += 50
 
-        away_score = str(game['away']['runs'])
-        home_score = str(game['home']['runs'])
-
-        if len(away_score) > 1:
-            self.display_manager.draw_text(Fonts.ter_u28b, column_offset-self._ddo,
-                row_offset, color, away_score)
-        else:
-            self.display_manager.draw_text(Fonts.ter_u28b, column_offset,
-                row_offset, color, away_score)
-
-        if len(home_score) > 1:
-            self.display_manager.draw_text(Fonts.ter_u28b, column_offset-self._ddo,
-                row_offset+20, color, home_score)
-        else:
-            self.display_manager.draw_text(Fonts.ter_u28b, column_offset,
-                row_offset+20, color, home_score)
+        away_offset, away_score = _number_layout(game['away']['runs'])
+        home_offset, home_score = _number_layout(game['home']['runs'])
 
-    def _print_text(self, text: str, column_offset: int, row_offset: int, font, i: int):
-        c, r = self._calculate_offset(i)
-        color = self._calculate_color(i)
+        self._draw_text(self._large_font, column_offset - away_offset,
+            row_offset, color, away_score)
+        self._draw_text(self._large_font, column_offset - home_offset,
+            row_offset+20, color, home_score)
 
-        column_offset += c
-        row_offset += r + 10
-
-        self.display_manager.draw_text(font, column_offset,
-            row_offset, color, text)
-
-    def _print_inning(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+    def _print_text(self, text: str, x: int, y: int, font,
+        column_offset: int, row_offset: int, color):
+        self._draw_text(font, column_offset + x,
+            row_offset + y + 10, color, text)
 
+    def _print_inning(self, game: dict, column_offset: int, row_offset: int, color):
         column_offset += 74
         row_offset += 10
 
-        inning = game['inning']
-        inning = str(inning)
-
-        if len(inning) > 1:
-            self.display_manager.draw_text(Fonts.ter_u28b, column_offset-self._ddo,
-                row_offset, color, inning)
-        else:
-            self.display_manager.draw_text(Fonts.ter_u28b, column_offset,
-                row_offset, color, inning)
+        inning_offset, inning = _number_layout(game['inning'])
 
-    def _print_inning_arrows(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+        self._draw_text(self._large_font, column_offset - inning_offset,
+            row_offset, color, inning)
 
+    def _print_inning_arrows(self, game: dict, column_offset: int, row_offset: int, color):
         column_offset += 80
 
         inning_state = game['inning_state']
 
         if inning_state == 'T':
-            self.display_manager.draw_inning_arrow(column_offset, row_offset-11, 7, True, color)
+            self._draw_inning_arrow(column_offset, row_offset-11, 7, True, color)
         elif inning_state == 'B':
-            self.display_manager.draw_inning_arrow(column_offset, row_offset+12, 7, False, color)
-
-    def _print_bases(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+            self._draw_inning_arrow(column_offset, row_offset+12, 7, False, color)
 
+    def _print_bases(self, game: dict, column_offset: int, row_offset: int, color):
         column_offset += 109
         row_offset -= 8
 
@@ -111,23 +177,12 @@ class Overview:
         thickness = 2
         delta = radius + 2 # could set this to 0 to make the bases touch
 
-        runners_int = game['runners']
-        runners = [False, False, False]
-        for j in range(3):
-            if runners_int & (1 << j):
-                runners[j] = True
-
-        self.display_manager.draw_diamond(column_offset+delta, row_offset+delta, radius,
-            thickness, runners[0], color)
-        self.display_manager.draw_diamond(column_offset, row_offset, radius,
-            thickness, runners[1], color)
-        self.display_manager.draw_diamond(column_offset-delta, row_offset+delta, radius,
-            thickness, runners[2], color)
+        runners = RUNNER_TABLE[game['runners'] & 7]
 
-    def _print_outs(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+        self._draw_bases(column_offset, row_offset, radius, delta,
+            thickness, runners, color)
 
+    def _print_outs(self, game: dict, column_offset: int, row_offset: int, color):
         column_offset += 109
         row_offset += 12
 
@@ -140,23 +195,34 @@ class Overview:
         if outs_int is None:
             return
 
-        outs = [False, False, False]
-        for j in range(3):
-            if outs_int > j:
-                outs[j] = True
-
-        self.display_manager.draw_circle(column_offset-delta, row_offset, radius,
-            thickness, outs[0], color)
-        self.display_manager.draw_circle(column_offset, row_offset, radius,
-            thickness, outs[1], color)
-        self.display_manager.draw_circle(column_offset+delta, row_offset, radius,
-            thickness, outs[2], color)
+        outs = OUT_TABLE[min(outs_int, 3)]
+
+        self._draw_circle_row(column_offset-delta, row_offset, delta, radius,
+            thickness, outs, color)
         return
 
-    def _print_start_time(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+    def _print_final(self, game: dict, column_offset: int, row_offset: int, color):
+        inning = game['inning']
+        self._print_text('F', 74, 0, self._large_font,
+            column_offset, row_offset, color)
+        if inning != 9:
+            # Multiple print statements to squeeze the text into
+            # tight space
+            self._print_text('/', 84, 0, self._large_font,
+                column_offset, row_offset, color)
+            self._print_text(f'{inning}', 94, 0, self._large_font,
+                column_offset, row_offset, color)
+
+    def _print_suspended(self, game: dict, column_offset: int, row_offset: int, color):
+        # Suspended / Postposed
+        self._print_text('SUSP', 92, -4, self._small_font,
+            column_offset, row_offset, color)
+
+    def _print_delayed(self, game: dict, column_offset: int, row_offset: int, color):
+        self._print_text('DLY', 92, -4, self._small_font,
+            column_offset, row_offset, color)
 
+    def _print_start_time(self, game: dict, column_offset: int, row_offset: int, color):
         column_offset += 50
         row_offset += 10
 
@@ -164,65 +230,108 @@ class Overview:
         if len(start_time) < 5:
             start_time = ' ' + start_time
 
-        self.display_manager.draw_text(Fonts.ter_u28b, column_offset,
+        self._draw_text(self._large_font, column_offset,
             row_offset, color, start_time)
 
-    def print_game(self, game: dict, i: int):
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
+    def print_game(self, game: dict, i: int, force: bool = False) -> bool:
+        """
+        Prints a game in the given slot. The slot is only cleared and
+        redrawn if the game looks different from what was last drawn
+        there.
 
-        self.clear_game(i)
+        Args:
+            game (dict): The game, or None to leave the slot empty
+            i (int): The slot to print the game in
+            force (bool): Redraw the slot even if the game did not
+                change. Should be used after the slot was cleared or the
+                brightness was changed
 
+        Returns:
+            bool: True if anything was drawn in the slot
+        """
         if game is None:
-            return
+            # Empty slots that were never drawn are already blank
+            if self._last_rendered.pop(i, None) is not None:
+                self.clear_game(i)
+                return True
+            return False
+
+        column_offset, row_offset = self._slot_offsets[i]
+        color = self._slot_colors[i]
+
+        snapshot = self._snapshot(game)
+        previous = self._last_rendered.get(i)
+        if (not force) and (previous == snapshot):
+            return False
+        self._last_rendered[i] = snapshot
+
+        if (not force) and self._print_live_changes(previous, snapshot,
+            game, column_offset, row_offset, color):
+            return True
+
+        self.clear_game(i)
 
         away_team = game['away']['abv']
         home_team = game['home']['abv']
 
-        self.display_manager.draw_text(Fonts.ter_u28b, column_offset,
+        self._draw_text(self._large_font, column_offset,
             row_offset, color, away_team)
-        self.display_manager.draw_text(Fonts.ter_u28b, column_offset,
+        self._draw_text(self._large_font, column_offset,
             row_offset+20, color, home_team)
 
-        game_state = game['game_state']
-
-        # Live
-        if game_state == 'L':
-            self._print_scores(game, i)
-            self._print_inning(game, i)
-            self._print_inning_arrows(game, i)
-            self._print_bases(game, i)
-            self._print_outs(game, i)
-
-        # Final
-        elif game_state == 'F':
-            self._print_scores(game, i)
-            inning = game['inning']
-            if inning == 9:
-                self._print_text('F', 74, 0, Fonts.ter_u28b, i)
-            else:
-                # Multiple print statements to squeeze the text into
-                # tight space
-                self._print_text('F', 74, 0, Fonts.ter_u28b, i)
-                self._print_text('/', 84, 0, Fonts.ter_u28b, i)
-                self._print_text(f'{inning}', 94, 0, Fonts.ter_u28b, i)
-
-        # Pregame
-        elif game_state == 'P':
-            self._print_start_time(game, i)
+        for printer in self._state_printers.get(game['game_state'], ()):
+            printer(game, column_offset, row_offset, color)
 
-        # Suspended / Postposed
-        elif game_state == 'S':
-            self._print_scores(game, i)
-            self._print_inning(game, i)
-            self._print_text('SUSP', 92, -4, Fonts.ter_u16b, i)
-
-        # Delay
-        elif game_state == 'D':
-            self._print_scores(game, i)
-            self._print_inning(game, i)
-            self._print_inning_arrows(game, i)
-            self._print_text('DLY', 92, -4, Fonts.ter_u16b, i)
+        return True
+
+    def _print_live_changes(self, previous: tuple, snapshot: tuple, game: dict,
+        column_offset: int, row_offset: int, color) -> bool:
+        """
+        Redraws only the parts of a live game that changed since it was
+        last drawn in the slot. Only works if the slot already shows the
+        same live game.
+
+        Args:
+            previous (tuple): The snapshot last drawn in the slot
+            snapshot (tuple): The snapshot of the game
+            game (dict): The game
+            column_offset (int): Column offset of the slot
+            row_offset (int): Row offset of the slot
+            color (graphics.Color): Color of the slot
+
+        Returns:
+            bool: True if the changes were drawn, False if the whole
+                slot needs to be redrawn
+        """
+        if (previous is None) or (snapshot[0] != 'L') or (previous[:3] != snapshot[:3]):
+            return False
+
+        # Scores and innings past 99 can print wider than the cleared
+        # section, so redraw the whole slot when one is or was drawn
+        if not all(map(_in_table, previous[3:6] + snapshot[3:6])):
+            return False
+
+        # Scores, inning and inning arrows
+        if previous[3:7] != snapshot[3:7]:
+            self._clear_section(column_offset+42, row_offset-20,
+                column_offset+93, row_offset+22)
+            self._print_scores(game, column_offset, row_offset, color)
+            self._print_inning(game, column_offset, row_offset, color)
+            self._print_inning_arrows(game, column_offset, row_offset, color)
+
+        # Bases
+        if previous[7] != snapshot[7]:
+            self._clear_section(column_offset+94, row_offset-20,
+                column_offset+127, row_offset+7)
+            self._print_bases(game, column_offset, row_offset, color)
+
+        # Outs
+        if previous[8] != snapshot[8]:
+            self._clear_section(column_offset+94, row_offset+8,
+                column_offset+127, row_offset+22)
+            self._print_outs(game, column_offset, row_offset, color)
+
+        return True
 
     def _time_delta_strftime(self, delay: int) -> str:
         """
@@ -235,9 +344,8 @@ class Overview:
         Returns:
             str: Formatted time string
         """
-        hours = math.floor(delay / 3600)
-        minutes = math.floor((delay - hours * 3600) / 60)
-        seconds = delay - hours * 3600 - minutes * 60
+        hours, seconds = divmod(delay, 3600)
+        minutes, seconds = divmod(seconds, 60)
 
         if hours == 0 and minutes == 0:
             return f'      {seconds:2}'
@@ -248,13 +356,6 @@ class Overview:
     def print_time(self, delay: int, i: int):
         # Texts need to move to better looking location
         # But all the logic is here
-        self.clear_game(i)
-
-        column_offset, row_offset = self._calculate_offset(i)
-        color = self._calculate_color(i)
-
-        column_offset += 33
-
         current_time = datetime.datetime.now()
         delay_delta = datetime.timedelta(seconds=delay)
         delay_time = current_time - delay_delta
@@ -271,19 +372,32 @@ class Overview:
         if delay_time[0] == '0':
             delay_time = ' ' + delay_time[1:]
 
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset-16,
+        # called every 0.1s but the text only changes once a second
+        # skip the clear, redraw and swap if nothing on screen would change
+        snapshot = ('time', delay_date, delay_time, delay)
+        if self._last_rendered.get(i) == snapshot:
+            return
+        self._last_rendered[i] = snapshot
+        self.clear_game(i)
+
+        column_offset, row_offset = self._slot_offsets[i]
+        color = self._slot_colors[i]
+
+        column_offset += 33
+
+        self._draw_text(self._small_font, column_offset-16,
             row_offset-6, color, delay_date)
         # self.display_manager.draw_text(Fonts.ter_u16b, column_offset,
         #     row_offset-6, color, current_time)
 
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset,
+        self._draw_text(self._small_font, column_offset,
             row_offset+6, color, delay_time)
 
         if len(delay) > 8:
             # incase delay is super large
             # like it is in offseason testing
             column_offset -= (8 * (len(delay) - 8))
-        self.display_manager.draw_text(Fonts.ter_u16b, column_offset,
+        self._draw_text(self._small_font, column_offset,
             row_offset+18, color, delay)
 
         self.display_manager.swap_frame()
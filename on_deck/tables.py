@@ -0,0 +1,29 @@
+"""
+Lookup tables shared by the gamecast and overview so the numbers,
+bases and circles do not have to be worked out on every draw.
+"""
+
+# Which bases/circles are filled in, indexed by the runners bitmask
+# or by the number of balls, strikes or outs
+RUNNER_TABLE = tuple((bool(i & 1), bool(i & 2), bool(i & 4)) for i in range(8))
+BALL_TABLE = tuple(tuple(j < i for j in range(4)) for i in range(5))
+STRIKE_TABLE = tuple(tuple(j < i for j in range(3)) for i in range(4))
+OUT_TABLE = STRIKE_TABLE
+
+# Preformatted strings for the small numbers shown on the scoreboard
+DIGITS = tuple(map(str, range(100)))
+
+def double_digit_offsets(offset: int) -> tuple:
+    """
+    Returns the number of pixels to shift each number from 0 to 99 left
+    by so double digit numbers stay centered in their column. Index
+    with min(value, 99) so larger numbers get the double digit offset.
+
+    Args:
+        offset (int): Pixels to shift double digit numbers left by.
+            About half the width of a digit in the font used
+
+    Returns:
+        tuple: The offset of each number
+    """
+    return tuple(0 if i < 10 else offset for i in range(100))
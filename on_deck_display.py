@@ -30,6 +30,10 @@ else:
 brightness_dict_2pwm = {0: 0, 1: 60, 2: 80, 3: 90}
 redis_ip = '192.168.1.83'
 
+# Pubsub channels that change settings instead of carrying game data
+gamecast_settings_channels = frozenset((b'gamecast_id', b'brightness', b'mode', b'delay'))
+overview_settings_channels = frozenset((b'mode', b'brightness', b'init'))
+
 def get_options() -> RGBMatrixOptions:
     """
     Returns the RGBMatrixOptions object based on the platform.
@@ -65,11 +69,18 @@ def recursive_update(d: dict, u: dict) -> dict:
     Returns:
         dict: Updated dictionary
     """
-    for k, v in u.items():
-        if isinstance(v, dict):
-            d[k] = recursive_update(d.get(k, {}), v)
-        else:
-            d[k] = v
+    # Walk the nested dicts with a stack instead of recursing. New
+    # subtrees are taken from u as is since u is a freshly decoded
+    # message that is not used again
+    stack = [(d, u)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            sub = dst.get(k)
+            if isinstance(v, dict) and isinstance(sub, dict):
+                stack.append((sub, v))
+            else:
+                dst[k] = v
     return d
 
 class TimeHandler:
@@ -79,22 +90,34 @@ class TimeHandler:
     messages from the redis server and update the time based on the
     message received.
     """
+    __slots__ = ('display_manager', 'overview', 'redis', 'pubsub', 'delay')
+
     def __init__(self, display_manager: DisplayManager, overview: Overview):
         self.display_manager = display_manager
         self.overview = overview
 
         self.redis = redis.Redis(redis_ip, port=6379, db=0, password='ondeck')
 
+        # Subscribe before reading the delay so a change published in
+        # between is not missed
+        self.pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        self.pubsub.subscribe('delay')
+        self.delay = int(self.redis.get('delay'))
+
     def start(self):
         """
         Continuously prints the time on the scoreboard. The time is the
         delay time for the current game. This function will print the
-        time and then wait 100ms before printing the time again
+        time and then wait up to 100ms for the delay to change before
+        printing the time again
         """
         while True:
-            delay = int(self.redis.get('delay'))
-            self.overview.print_time(delay, 17)
-            time.sleep(.1)
+            self.overview.print_time(self.delay, 17)
+
+            message = self.pubsub.get_message(timeout=.1)
+            while message:
+                self.delay = int(message['data'])
+                message = self.pubsub.get_message(timeout=0)
 
 class GamecastHandler:
     """
@@ -103,6 +126,9 @@ class GamecastHandler:
     current game. This class will listen for messages from the redis
     server and update the gamecast data based on the message received.
     """
+    __slots__ = ('display_manager', 'game', 'redis', 'pubsub', 'mode', 'gamecast',
+        'gamecast_game')
+
     def __init__(self, display_manager: DisplayManager):
         self.display_manager = display_manager
         self.game: dict = None
@@ -113,10 +139,16 @@ class GamecastHandler:
         self.pubsub.subscribe('brightness')
         self.pubsub.subscribe('gamecast_id')
         self.pubsub.subscribe('mode')
+        # The fetcher rebuilds the gamecast game when the delay changes
+        self.pubsub.subscribe('delay')
 
         brightness = int(self.redis.get('brightness'))
         self.display_manager.set_brightness(brightness_dict_2pwm[brightness])
 
+        # Kept up to date from the mode channel so the mode does not
+        # have to be fetched from the redis server for every message
+        self.mode: bytes = self.redis.get('mode')
+
         self.gamecast: Gamecast = Gamecast(self.display_manager)
         self.gamecast_game: dict = None
 
@@ -132,13 +164,69 @@ class GamecastHandler:
         self.gamecast_game = game
         return game
 
+    def _get_gamepk(self, game_id: bytes) -> Union[int, None]:
+        """
+        Looks up the gamepk of a game stored in the redis server.
+
+        Args:
+            game_id (bytes): Redis key of the game
+
+        Returns:
+            Union[int, None]: The gamepk, or None if there is no such
+                game or it has no gamepk
+        """
+        game = self.redis.get(game_id)
+        if game is None:
+            return None
+
+        gamepk = json.loads(game).get('gamepk')
+        if gamepk is None:
+            return None
+        return int(gamepk)
+
+    def wait_for_gamecast(self, gamepk: int = None, timeout: float = 1) -> dict:
+        """
+        Waits for the fetcher to update the gamecast data in the redis
+        server. Returns as soon as the stored data is for the expected
+        game, or has changed if no game is given, instead of always
+        waiting the full timeout.
+
+        Args:
+            gamepk (int): Gamepk of the game the fetcher is switching
+                to. The old game can still be written while the switch
+                is in progress so only this game counts as updated
+            timeout (float): Maximum number of seconds to wait
+
+        Returns:
+            dict: The gamecast game data
+        """
+        old_data = self.redis.get('gamecast')
+        new_data = old_data
+        game = json.loads(new_data)
+        stop_time = time.monotonic() + timeout
+
+        while time.monotonic() < stop_time:
+            if gamepk is None:
+                if new_data != old_data:
+                    break
+            elif int(game['gamepk']) == gamepk:
+                break
+
+            time.sleep(.05)
+            new_data = self.redis.get('gamecast')
+            game = json.loads(new_data)
+
+        return game
+
     def change_settings(self, message: dict):
         """
         Changes the settings based on the message received from the
-        pubsub listener. The settings that can be changed are the mode
-        and the brightness. This function will also call the appropriate
-        function to print the correct data based on the mode to ahcieve
-        maximum speed.
+        pubsub listener. The settings that can be changed are the mode,
+        the brightness, the gamecast game and the delay. A new gamecast
+        game or delay makes the fetcher rebuild the gamecast game, so
+        this waits for it before redrawing. This function will also call
+        the appropriate function to print the correct data based on the
+        mode to ahcieve maximum speed.
 
         Args:
             message (dict): Message received from the pubsub listener
@@ -147,26 +235,26 @@ class GamecastHandler:
 
         if channel in (b'gamecast_id', b'delay'):
             print('waiting')
-            time.sleep(1) # delay to let fetcher update gamecast
-            new_data = self.redis.get('gamecast')
-            new_data = json.loads(new_data)
+            gamepk = None
+            if channel == b'gamecast_id':
+                gamepk = self._get_gamepk(message['data'])
+            new_data = self.wait_for_gamecast(gamepk)
             self.gamecast_game = new_data
-            self.gamecast.print_game(self.gamecast_game)
+            self.gamecast.print_game(self.gamecast_game, force=True)
             return
 
         if channel == b'brightness':
             brightness = int(message['data'])
             self.display_manager.set_brightness(brightness_dict_2pwm[brightness])
-            self.gamecast.print_game(self.gamecast_game)
+            self.gamecast.print_game(self.gamecast_game, force=True)
             return
 
-        mode = self.redis.get('mode')
         if channel == b'mode':
-            mode = message['data']
+            self.mode = message['data']
 
-        if mode == b'gamecast':
+        if self.mode == b'gamecast':
             self.display_manager.clear_section(129, 0, 384, 256)
-            self.gamecast.print_game(self.gamecast_game)
+            self.gamecast.print_game(self.gamecast_game, force=True)
             return
 
     def update_gamecast(self) -> Union[bool, dict]:
@@ -174,13 +262,14 @@ class GamecastHandler:
         Updates the gamecast data based on the message received from the
         pubsub listener. This function will only update the gamecast data
         if the message is a gamecast message. If the message is not a
-        gamecast message, the function will return False.
+        gamecast message, the function will return False. Blocks until
+        a message is received.
 
         Returns:
             Union[bool, dict]: The new data received from the pubsub
                 or False if the message is not a gamecast message
         """
-        message = self.pubsub.get_message(timeout=5)
+        message = self.pubsub.get_message(timeout=None)
 
         if not message:
             return False
@@ -188,7 +277,7 @@ class GamecastHandler:
         if message['type'] != 'message':
             return False
 
-        if message['channel'] in (b'gamecast_id', b'brightness', b'mode', b'delay'):
+        if message['channel'] in gamecast_settings_channels:
             self.change_settings(message)
             return False
 
@@ -213,8 +302,7 @@ class GamecastHandler:
         if new_data is False:
             return False
 
-        mode = self.redis.get('mode')
-        if mode != b'gamecast':
+        if self.mode != b'gamecast':
             return False
 
         self.gamecast.print_game(self.gamecast_game)
@@ -240,9 +328,12 @@ class OverviewHandler:
     overview data is the small display that just shows scores, inning,
     bases, and outs.
     """
-    def __init__(self, display_manager: DisplayManager):
+    __slots__ = ('display_manager', 'overview', 'redis', 'pubsub', 'games', '_lock',
+        '_page', 'mode', '_gamecast_mode', '_mode_changed')
+
+    def __init__(self, display_manager: DisplayManager, overview: Overview):
         self.display_manager = display_manager
-        self.overview = Overview(self.display_manager)
+        self.overview = overview
 
         self.redis = redis.Redis(redis_ip, port=6379, db=0, password='ondeck')
         self.pubsub = self.redis.pubsub()
@@ -251,8 +342,25 @@ class OverviewHandler:
 
         self.games: List[dict] = []
 
+        # The pubsub thread updates and draws games while the main
+        # thread draws the gamecast pages. The lock makes sure a game is
+        # never drawn while it is half updated
+        self._lock = threading.RLock()
+
         self._page: int = None
 
+        # Kept up to date from the mode channel so the mode does not
+        # have to be fetched from the redis server for every message
+        self.mode: bytes = self.redis.get('mode')
+
+        # Set while the mode is gamecast so the page loop can block
+        # instead of spinning while the overview is shown
+        self._gamecast_mode = threading.Event()
+
+        # Set when the mode changes so the page loop can stop waiting
+        # for the next page and start over from the first page
+        self._mode_changed = threading.Event()
+
     def _initialize_games(self):
         num_games = int(self.redis.get('num_games'))
 
@@ -262,47 +370,68 @@ class OverviewHandler:
             game = json.loads(game)
             self.games.append(game)
 
-    def print_overview(self):
+    def print_overview(self, force: bool = False):
         """
         Prints all the games in the overview mode. It prints all games
         in three columns. This function only needs to be called when the
         mode is changed. When new data is received, the pubsub_listener
         function will update the data.
+
+        Args:
+            force (bool): Redraw games that did not change. Should be
+                used after the display was cleared
         """
         num_games = len(self.games)
 
         for i in range(num_games):
-            self.overview.print_game(self.games[i], i)
+            self.overview.print_game(self.games[i], i, force)
 
-    def print_gamecast_page(self):
+    def print_gamecast_page(self, force: bool = False):
         """
         Prints the current page of games in the gamecast mode. It prints
         all games in one columns. This function can be called anytime
-        and will only print the current page of games.
+        and will only print the current page of games. Slots past the
+        last game are only cleared if they had a game in them.
+
+        Args:
+            force (bool): Redraw games that did not change. Should be
+                used after the display was cleared
         """
-        self.display_manager.clear_section(0, 0, 128, 256)
-        for i in range(6):
-            game = self._page * 6 + i
-            if game >= len(self.games):
+        with self._lock:
+            # The mode can change between the page loop checking it and
+            # the lock being taken. Don't draw a page over the overview
+            if self.mode != b'gamecast':
                 return
-            self.overview.print_game(self.games[game], i)
-        self.display_manager.swap_frame()
+
+            start = self._page * 6
+            page = self.games[start:start+6]
+            page += [None] * (6 - len(page))
+            for i, game in enumerate(page):
+                self.overview.print_game(game, i, force)
+            self.display_manager.swap_frame()
 
     def print_gamecast_pages(self):
         """
         Cycles through all the pages of games when in the gamecast mode.
         The iterator is stored in the self._page variable. This function
         will only print the current page of games and will wait 5 seconds
+        or until the mode changes
         """
         num_games = len(self.games)
         num_pages = math.ceil(num_games / 6)
 
+        if num_pages == 0:
+            time.sleep(5)
+            return
+
+        self._mode_changed.clear()
         for self._page in range(num_pages):
-            mode = self.redis.get('mode')
-            if mode != b'gamecast':
+            if self.mode != b'gamecast':
                 return
             self.print_gamecast_page()
-            time.sleep(5)
+            if self._mode_changed.wait(5):
+                self._mode_changed.clear()
+                return
 
     def change_settings(self, message: dict):
         """
@@ -318,12 +447,21 @@ class OverviewHandler:
         channel = message['channel']
 
         if channel == b'mode':
+            self.mode = message['data']
             if message['data'] == b'overview':
                 self.display_manager.clear_section(0, 0, 384, 256)
+                self.overview.invalidate()
             elif message['data'] == b'gamecast':
                 self.display_manager.clear_section(0, 0, 128, 256)
+                self.overview.invalidate()
             self._page = 0
 
+            if message['data'] == b'gamecast':
+                self._gamecast_mode.set()
+            else:
+                self._gamecast_mode.clear()
+            self._mode_changed.set()
+
         if channel == b'brightness':
             x = int(message['data'])
             self.display_manager.set_brightness(brightness_dict_2pwm[x])
@@ -331,28 +469,29 @@ class OverviewHandler:
         if channel == b'init':
             self._initialize_games()
 
-        mode = self.redis.get('mode')
-        if mode == b'overview':
-            self.print_overview()
-        elif mode == b'gamecast':
-            self.print_gamecast_page()
+        if self.mode == b'overview':
+            self.print_overview(force=True)
+        elif self.mode == b'gamecast':
+            self.print_gamecast_page(force=True)
 
-    def pubsub_listener(self):
+    def update_game(self, message: dict) -> Union[int, None]:
         """
-        Listens for messages from the pubsub and updates the games
-        based on the message received.
-        """
-        message = self.pubsub.get_message(timeout=5)
+        Updates a game based on the message received from the pubsub
+        listener. Settings messages are passed on to change_settings.
 
-        if not message:
-            return
+        Args:
+            message (dict): Message received from the pubsub listener
 
+        Returns:
+            Union[int, None]: The id of the game that was updated or
+                None if the message did not update a game
+        """
         if message['type'] != 'message':
-            return
+            return None
 
-        if message['channel'] in (b'mode', b'brightness', b'init'):
+        if message['channel'] in overview_settings_channels:
             self.change_settings(message)
-            return
+            return None
 
         # print(f'{message=}\n')
 
@@ -360,14 +499,42 @@ class OverviewHandler:
         new_data = message['data'].decode('utf-8')
         new_data = json.loads(new_data)
         self.games[game_id] = recursive_update(self.games[game_id], new_data)
+        return game_id
+
+    def pubsub_listener(self):
+        """
+        Listens for messages from the pubsub and updates the games
+        based on the message received. Every message that is already
+        waiting is merged before anything is drawn so a burst of
+        updates to the same game only redraws it once. Blocks until
+        a message is received.
+        """
+        updated_games = set()
+        drawn = False
+        message = self.pubsub.get_message(timeout=None)
+
+        if not message:
+            return
 
-        mode = self.redis.get('mode')
-        if mode == b'overview':
-            self.overview.print_game(self.games[game_id], game_id)
-        elif mode == b'gamecast':
-            page = math.floor(game_id / 6)
-            if page == self._page:
-                self.overview.print_game(self.games[game_id], game_id % 6)
+        with self._lock:
+            while message:
+                game_id = self.update_game(message)
+                if game_id is not None:
+                    updated_games.add(game_id)
+                message = self.pubsub.get_message(timeout=0)
+
+            for game_id in sorted(updated_games):
+                if self.mode == b'overview':
+                    drawn |= self.overview.print_game(self.games[game_id], game_id)
+                elif self.mode == b'gamecast':
+                    page = game_id // 6
+                    if page == self._page:
+                        drawn |= self.overview.print_game(self.games[game_id], game_id % 6)
+
+            # The clock only swaps when the time changes, so show the
+            # updated games right away
+            if drawn:
+                self.display_manager.swap_frame()
 
     def pubsub_thread(self):
         """
@@ -386,12 +553,14 @@ class OverviewHandler:
         """
         self._initialize_games()
         self.display_manager.clear_section(0, 0, 128, 256)
-        mode = self.redis.get('mode')
-        if mode == b'overview':
+        if self.mode == b'overview':
             self.print_overview()
+        elif self.mode == b'gamecast':
+            self._gamecast_mode.set()
 
         threading.Thread(target=self.pubsub_thread, daemon=True).start()
         while True:
+            self._gamecast_mode.wait()
             self.print_gamecast_pages()
 
 class Scoreboard:
@@ -404,7 +573,7 @@ class Scoreboard:
         self.overview = Overview(self.display_manager)
 
         self.time_handler = TimeHandler(self.display_manager, self.overview)
-        self.overview_handler = OverviewHandler(self.display_manager)
+        self.overview_handler = OverviewHandler(self.display_manager, self.overview)
         self.gamecast_handler = GamecastHandler(self.display_manager)
 
     def start(self):
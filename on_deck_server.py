@@ -28,17 +28,16 @@ class Server:
             Response: HTML Response
         """
         num_games = self.redis.get('num_games')
-        games: List[dict] = []
 
-        if (num_games == 0) or (num_games is None):
+        if (num_games is None) or (int(num_games) == 0):
             return Response(json.dumps({}, indent=4), status=200, mimetype='application/json')
 
-        for i in range(int(num_games)-1):
-            game = self.redis.get(str(i))
-            game = json.loads(game)
-            games.append(game)
+        # The games are already stored as JSON so fetch them all at once
+        # and join them into a list without decoding them
+        games: List[bytes] = self.redis.mget([str(i) for i in range(int(num_games))])
+        games = b'[' + b','.join(game for game in games if game is not None) + b']'
 
-        return Response(json.dumps(games, indent=4), status=200, mimetype='application/json')
+        return Response(games, status=200, mimetype='application/json')
 
     def reboot(self):
         """
@@ -116,9 +115,21 @@ class Server:
         return Response(json.dumps(game, indent=4), status=200, mimetype='text/plain')
 
     def gamecast(self):
+        """
+        Returns the gamecast game stored in redis. The stored JSON is
+        passed through as is as application/json unless ?pretty=1 is
+        given, in which case it is decoded and indented as text/plain
+        for reading in a browser
+
+        Returns:
+            Response: HTML Response
+        """
         gamecast_game = self.redis.get('gamecast')
-        gamecast_game = json.loads(gamecast_game)
 
+        if not request.args.get('pretty', default=0, type=int):
+            return Response(gamecast_game, status=200, mimetype='application/json')
+
+        gamecast_game = json.loads(gamecast_game)
         return Response(json.dumps(gamecast_game, indent=4), status=200, mimetype='text/plain')
 
 server = Server()
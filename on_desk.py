@@ -62,6 +62,19 @@ ABV_B = 'TEX'
 on_time = datetime.time(0, 0)
 off_time = datetime.time(23,59)
 
+# ter_u22b digits are 11 pixels wide. Every digit past the first shifts
+# the number half a digit left so it stays centered
+HALF_DIGIT = 5
+
+# symbols font glyphs for the 3 outs indexed by the number of outs.
+# P is a filled circle and p is an empty one
+OUTS_GLYPHS = ('ppp', 'Ppp', 'PPp', 'PPP')
+
+# symbols font glyphs for first, second and third base indexed by the
+# runners bitmask. C is an occupied base and c is an empty one
+BASES_GLYPHS = tuple(''.join('C' if runners & (1 << j) else 'c' for j in range(3))
+    for runners in range(8))
+
 def get_options() -> RGBMatrixOptions:
     """
     Returns the RGBMatrixOptions object based on the platform.
@@ -151,6 +164,15 @@ class Scoreboard:
 
         self.games = games
 
+        # What to draw for each game state
+        self._state_printers = {
+            'P': (self._print_teams, self._print_start_time, self._print_standings),
+            'L': (self._print_teams, self._print_score, self._print_inning,
+                self._print_runners, self._print_outs, self._print_inning_arrows),
+            'F': (self._print_teams, self._print_score, self._print_inning,
+                self._print_standings),
+        }
+
     def start(self):
         self._print_welcome()
         while True:
@@ -185,22 +207,8 @@ class Scoreboard:
 
         self.display_manager.clear_section(0, i*32, 128, 32+32*i)
 
-        if game.game_state == 'P':
-            self._print_teams(i, game)
-            self._print_start_time(i, game)
-            self._print_standings(i, game)
-        if game.game_state == 'L':
-            self._print_teams(i, game)
-            self._print_score(i, game)
-            self._print_inning(i, game)
-            self._print_runners(i, game)
-            self._print_outs(i, game)
-            self._print_inning_arrows(i, game)
-        if game.game_state == 'F':
-            self._print_teams(i, game)
-            self._print_score(i, game)
-            self._print_inning(i, game)
-            self._print_standings(i, game)
+        for printer in self._state_printers.get(game.game_state, ()):
+            printer(i, game)
 
     def _get_color(self, i):
         if i == 0:
@@ -223,6 +231,9 @@ class Scoreboard:
         color = self._get_color(i)
         offset = self._get_offset(i)
 
+        draw_text = self.display_manager.draw_text
+        ter_u18b = Fonts.ter_u18b
+
         start_time = game.start_time
 
         if i == 1:
@@ -236,14 +247,17 @@ class Scoreboard:
 
         # eliminates some of the wasted space in : since using
         # monospaced font
-        self.display_manager.draw_text(Fonts.ter_u18b, 35, 22 + offset, color, hour)
-        self.display_manager.draw_text(Fonts.ter_u18b, 53, 22 + offset, color, ':')
-        self.display_manager.draw_text(Fonts.ter_u18b, 60, 22 + offset, color, minute)
+        draw_text(ter_u18b, 35, 22 + offset, color, hour)
+        draw_text(ter_u18b, 53, 22 + offset, color, ':')
+        draw_text(ter_u18b, 60, 22 + offset, color, minute)
 
     def _print_runners(self, i, game):
         color = self._get_color(i)
         offset = self._get_offset(i)
 
+        draw_text = self.display_manager.draw_text
+        symbols = Fonts.symbols
+
         runners = game.runners
 
         second_base_column_offset = 95
@@ -252,47 +266,38 @@ class Scoreboard:
         base_gap = 2
         base_offset = base_length + base_gap
 
-        bases_list = ['c', 'c', 'c']
-        if runners & 1:
-            bases_list[0] = 'C'
-        if runners & 2:
-            bases_list[1] = 'C'
-        if runners & 4:
-            bases_list[2] = 'C'
+        bases_list = BASES_GLYPHS[runners & 7]
 
         x0 = second_base_column_offset + base_offset
         y0 = second_base_row_offset + base_offset
-        self.display_manager.draw_text(Fonts.symbols, x0, y0, color, bases_list[0])
+        draw_text(symbols, x0, y0, color, bases_list[0])
 
         x1 = second_base_column_offset
         y1 = second_base_row_offset
-        self.display_manager.draw_text(Fonts.symbols, x1, y1, color, bases_list[1])
+        draw_text(symbols, x1, y1, color, bases_list[1])
 
         x2 = second_base_column_offset - base_offset
         y2 = second_base_row_offset + base_offset
-        self.display_manager.draw_text(Fonts.symbols, x2, y2, color, bases_list[2])
+        draw_text(symbols, x2, y2, color, bases_list[2])
 
     def _print_outs(self, i, game):
         color = self._get_color(i)
         offset = self._get_offset(i)
 
-        outs = game.count.outs
-
-        outs_list = ['p', 'p', 'p']
+        draw_text = self.display_manager.draw_text
+        symbols = Fonts.symbols
 
+        outs = game.count.outs
         if outs is None:
-            pass
-        else:
-            if outs > 0:
-                outs_list[0] = 'P'
-            if outs > 1:
-                outs_list[1] = 'P'
-            if outs > 2:
-                outs_list[2] = 'P'
+            outs = 0
+
+        # The glyphs are 6 pixels wide but drawn 7 apart so they can't
+        # be drawn as one string
+        outs_glyphs = OUTS_GLYPHS[min(outs, 3)]
 
-        self.display_manager.draw_text(Fonts.symbols,  91, 29 + offset, color, outs_list[0])
-        self.display_manager.draw_text(Fonts.symbols,  98, 29 + offset, color, outs_list[1])
-        self.display_manager.draw_text(Fonts.symbols, 105, 29 + offset, color, outs_list[2])
+        draw_text(symbols,  91, 29 + offset, color, outs_glyphs[0])
+        draw_text(symbols,  98, 29 + offset, color, outs_glyphs[1])
+        draw_text(symbols, 105, 29 + offset, color, outs_glyphs[2])
 
     def _print_inning_arrows(self, i, game):
         color = self._get_color(i)
@@ -354,15 +359,11 @@ class Scoreboard:
         away = str(game.away.runs)
         home = str(game.home.runs)
 
-        if len(away) > 1:
-            self.display_manager.draw_text(Fonts.ter_u22b, 35, 15 + offset, color, away)
-        else:
-            self.display_manager.draw_text(Fonts.ter_u22b, 40, 15 + offset, color, away)
+        away_x = 40 - HALF_DIGIT * (len(away) - 1)
+        home_x = 40 - HALF_DIGIT * (len(home) - 1)
 
-        if len(home) > 1:
-            self.display_manager.draw_text(Fonts.ter_u22b, 35, 31 + offset, color, home)
-        else:
-            self.display_manager.draw_text(Fonts.ter_u22b, 40, 31 + offset, color, home)
+        self.display_manager.draw_text(Fonts.ter_u22b, away_x, 15 + offset, color, away)
+        self.display_manager.draw_text(Fonts.ter_u22b, home_x, 31 + offset, color, home)
 
     def _print_inning(self, i, game):
         color = self._get_color(i)
@@ -373,10 +374,8 @@ class Scoreboard:
         if game.game_state == 'F':
             inning = 'F'
 
-        if len(inning) > 1:
-            self.display_manager.draw_text(Fonts.ter_u22b, 57, 23 + offset, color, inning)
-        else:
-            self.display_manager.draw_text(Fonts.ter_u22b, 62, 23 + offset, color, inning)
+        inning_x = 62 - HALF_DIGIT * (len(inning) - 1)
+        self.display_manager.draw_text(Fonts.ter_u22b, inning_x, 23 + offset, color, inning)
 
 def start_game_handler(game_handler: GameHandler):
     """